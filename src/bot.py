@@ -1,16 +1,18 @@
 import logging
 import time
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
 
 from .config import Config
 from .database import ListingDatabase
 from .notifier import DiscordNotifier
-from .scrapers import BazosScraper, Listing
+from .scrapers import BazosScraper, Listing, create_session
 
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_INTERVAL_MINUTES = 60
+MAX_SCRAPE_WORKERS = 8
 
 
 class AutoAlertBot:
@@ -18,9 +20,12 @@ class AutoAlertBot:
         self.config = Config(config_path)
         self.database = ListingDatabase(self.config.database_path)
         self.notifier = DiscordNotifier()
+        # One pooled session serves every source so keep-alive connections
+        # are reused across searches
+        self.session = create_session()
         self.scrapers = {
-            "bazos_sk": BazosScraper("bazos_sk"),
-            "bazos_cz": BazosScraper("bazos_cz"),
+            "bazos_sk": BazosScraper("bazos_sk", self.session),
+            "bazos_cz": BazosScraper("bazos_cz", self.session),
         }
         logger.info("AutoAlertBot initialized")
 
@@ -30,76 +35,156 @@ class AutoAlertBot:
         Args:
             listings: List of Listing objects to process
         """
-        new_count = 0
+        status = {}
+        for source in {listing.source for listing in listings}:
+            status[source] = self.database.get_status_bulk(
+                source,
+                (
+                    listing.listing_id
+                    for listing in listings
+                    if listing.source == source
+                ),
+            )
+
+        to_insert = []
+        to_touch = []
+        to_notify = []
+        queued = set()
 
         for listing in listings:
-            if not self.database.is_listing_seen(listing.listing_id, listing.source):
-                self.database.add_listing(
-                    listing_id=listing.listing_id,
-                    source=listing.source,
-                    title=listing.title,
-                    url=listing.url,
-                    price=listing.price,
-                    image_url=listing.image_url,
-                    description=listing.description,
-                    location=listing.location,
-                    category=listing.category,
-                    date_posted=listing.date_posted,
-                    view_count=listing.view_count,
-                )
+            key = (listing.listing_id, listing.source)
+            if key in queued:
+                continue
+            queued.add(key)
+
+            seen, notified = status[listing.source]
+
+            if listing.listing_id in seen:
+                to_touch.append(key)
             else:
-                self.database.update_last_checked(listing.listing_id, listing.source)
-
-            if not self.database.is_listing_notified(
-                listing.listing_id, listing.source
-            ):
-                self.notifier.send_vehicle_notification(
-                    title=listing.title,
-                    url=listing.url,
-                    price=listing.price,
-                    year=listing.year,
-                    mileage=listing.mileage,
-                    location=listing.location,
-                    image_url=listing.image_url,
-                    description=listing.description,
-                    color=0xF16400,
+                to_insert.append(
+                    (
+                        listing.listing_id,
+                        listing.source,
+                        listing.title,
+                        listing.url,
+                        listing.price,
+                        listing.image_url,
+                        listing.description,
+                        listing.location,
+                        listing.category,
+                        listing.date_posted,
+                        listing.view_count,
+                    )
                 )
-                self.database.mark_as_notified(listing.listing_id, listing.source)
-                new_count += 1
-                logger.info(f"New listing notified: {listing.title}")
+
+            if listing.listing_id not in notified:
+                to_notify.append(listing)
+
+        self.database.bulk_insert(to_insert)
+        self.database.bulk_touch(to_touch)
+
+        embeds = [
+            self.notifier.build_vehicle_embed(
+                title=listing.title,
+                url=listing.url,
+                price=listing.price,
+                year=listing.year,
+                mileage=listing.mileage,
+                location=listing.location,
+                image_url=listing.image_url,
+                description=listing.description,
+                color=0xF16400,
+            )
+            for listing in to_notify
+        ]
+        delivered = self.notifier.send_many(embeds)
+        sent = [listing for listing, ok in zip(to_notify, delivered) if ok]
+
+        # Only rows whose message Discord accepted are marked; the rest are
+        # retried the next time a search returns them
+        for listing in sent:
+            logger.info("New listing notified: %s", listing.title)
+        new_count = len(sent)
+
+        self.database.bulk_mark_notified(
+            [(listing.listing_id, listing.source) for listing in sent]
+        )
 
         if new_count > 0:
-            logger.info(f"Processed {len(listings)} listings, {new_count} were new")
+            logger.info("Processed %s listings, %s were new", len(listings), new_count)
         else:
-            logger.debug(f"Processed {len(listings)} listings, no new ones found")
+            logger.debug("Processed %s listings, no new ones found", len(listings))
+
+    def _scrape_one(self, search_config: Dict) -> List[Listing]:
+        """Scrape a single configured search.
+
+        Errors are logged and reported to Discord so one failing search does
+        not abort the rest of the cycle.
+
+        Args:
+            search_config: Search configuration dictionary
+
+        Returns:
+            List of Listing objects found (empty on error)
+        """
+        source = search_config.get("source")
+        if not source:
+            logger.warning("Search config missing source: %s", search_config)
+            return []
+
+        scraper = self.scrapers.get(source)
+        if not scraper:
+            logger.warning("No scraper available for source: %s", source)
+            return []
+
+        try:
+            logger.info(
+                "Scraping %s with query: %s",
+                source,
+                search_config.get("name", "unnamed"),
+            )
+            return scraper.scrape(search_config)
+
+        except Exception as e:
+            logger.error("Error scraping %s: %s", source, e, exc_info=True)
+            self.notifier.send_notification(
+                title="⚠️ Scraping Error",
+                message=f"Error scraping {source}: {str(e)}",
+                color=0xFF0000,
+            )
+            return []
 
     def run_search_cycle(self):
-        """Run one complete search cycle for all configured searches."""
-        logger.info("Starting search cycle")
+        """Run one complete search cycle for all configured searches.
 
-        for search_config in self.config.searches:
-            source = search_config.get("source")
-            if not source:
-                logger.warning(f"Search config missing source: {search_config}")
-                continue
+        Searches are scraped concurrently; the results are then written to
+        the database one search at a time.
+        """
+        logger.info("Starting search cycle")
 
-            scraper = self.scrapers.get(source)
-            if not scraper:
-                logger.warning(f"No scraper available for source: {source}")
-                continue
+        searches = self.config.searches
+        if searches:
+            workers = min(MAX_SCRAPE_WORKERS, len(searches))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._scrape_one, searches))
+        else:
+            results = []
 
+        for search_config, listings in zip(searches, results):
             try:
-                logger.info(
-                    f"Scraping {source} with query: {search_config.get('name', 'unnamed')}"
-                )
-                listings = scraper.scrape(search_config)
                 self.process_listings(listings)
 
             except Exception as e:
-                logger.error(f"Error scraping {source}: {e}", exc_info=True)
+                source = search_config.get("source")
+                logger.error("Error processing %s: %s", source, e, exc_info=True)
+                # Refetch the pages in full next cycle instead of getting 304s
+                scraper = self.scrapers.get(source)
+                if scraper:
+                    scraper.discard_validators(search_config)
                 self.notifier.send_notification(
                     title="⚠️ Scraping Error",
-                    message=f"Error scraping {source}: {str(e)}",
+                    message=f"Error processing {source}: {str(e)}",
                     color=0xFF0000,
                 )
 
@@ -113,18 +198,21 @@ class AutoAlertBot:
             self.run_search_cycle()
             logger.info("Search cycle completed successfully")
         except Exception as e:
-            logger.error(f"Error in search cycle: {e}", exc_info=True)
+            logger.error("Error in search cycle: %s", e, exc_info=True)
             self.notifier.send_notification(
                 title="⚠️ Scraping Error",
                 message=f"Error during scheduled run: {str(e)}",
                 color=0xFF0000,
             )
             raise
+        finally:
+            self.close()
 
     def run_forever(self):
         """Run the bot continuously with configured interval."""
         logger.info(
-            f"Bot starting in continuous mode (interval: {DEFAULT_INTERVAL_MINUTES} minutes)"
+            "Bot starting in continuous mode (interval: %s minutes)",
+            DEFAULT_INTERVAL_MINUTES,
         )
 
         self.notifier.send_notification(
@@ -133,12 +221,24 @@ class AutoAlertBot:
             color=0x00FF00,
         )
 
+        interval = DEFAULT_INTERVAL_MINUTES * 60
+        next_tick = time.monotonic()
+
         while True:
             try:
                 self.run_search_cycle()
 
-                sleep_seconds = DEFAULT_INTERVAL_MINUTES * 60
-                logger.info(f"Sleeping for {DEFAULT_INTERVAL_MINUTES} minutes")
+                next_tick += interval
+                now = time.monotonic()
+                if now > next_tick:
+                    missed = int((now - next_tick) // interval) + 1
+                    logger.warning(
+                        "Search cycle overran the interval, skipping %s run(s)", missed
+                    )
+                    next_tick += missed * interval
+
+                sleep_seconds = next_tick - now
+                logger.info("Sleeping for %.1f minutes", sleep_seconds / 60)
                 time.sleep(sleep_seconds)
 
             except KeyboardInterrupt:
@@ -148,13 +248,20 @@ class AutoAlertBot:
                     message="Auto Alert Bot has been stopped.",
                     color=0xFF0000,
                 )
+                self.close()
                 break
 
             except Exception as e:
-                logger.error(f"Unexpected error in main loop: {e}", exc_info=True)
+                logger.error("Unexpected error in main loop: %s", e, exc_info=True)
                 self.notifier.send_notification(
                     title="⚠️ Bot Error",
                     message=f"Unexpected error: {str(e)}",
                     color=0xFF0000,
                 )
                 time.sleep(60)
+
+    def close(self):
+        """Release network and DB resources."""
+        self.notifier.close()
+        self.database.close()
+        self.session.close()
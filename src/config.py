@@ -1,8 +1,10 @@
-import json
 import logging
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List
 
+import orjson
+
 
 logger = logging.getLogger(__name__)
 
@@ -21,20 +23,19 @@ class Config:
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
 
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                config = json.load(f)
-                logger.info(f"Configuration loaded from {self.config_path}")
-                return config
-        except json.JSONDecodeError as e:
+            config = orjson.loads(self.config_path.read_bytes())
+            logger.info(f"Configuration loaded from {self.config_path}")
+            return config
+        except orjson.JSONDecodeError as e:
             logger.error(f"Invalid JSON in config file: {e}")
             raise
 
-    @property
+    @cached_property
     def searches(self) -> List[Dict]:
         """Get list of search configurations."""
         return self.data.get("searches", [])
 
-    @property
+    @cached_property
     def database_path(self) -> str:
         """Get database path."""
         return self.data.get("database_path", "./data/listings.db")
@@ -1,46 +1,105 @@
+import atexit
+import functools
 import logging
 import sqlite3
-from datetime import datetime
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional, Set, Tuple
 from contextlib import contextmanager
 
 
 logger = logging.getLogger(__name__)
 
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER was 999 before 3.32, keep
+# IN (...) lists safely below it (one slot is taken by the source param).
+MAX_BULK_PARAMS = 900
+
+# Per-connection tuning; journal_mode and page_size persist in the file and
+# are set once in _init_database.
+CONNECTION_PRAGMAS = (
+    "PRAGMA busy_timeout = 60000",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+)
+
+# Statements are kept as constants so the connection's statement cache can
+# reuse the compiled form across calls.
+SQL_SEEN = "SELECT 1 FROM listings WHERE source = ? AND id = ?"
+SQL_IS_NOTIFIED = "SELECT notified FROM listings WHERE source = ? AND id = ?"
+LISTING_COLUMNS = (
+    "id, source, title, url, price, image_url, description, location, "
+    "category, date_posted, view_count, first_seen, last_checked, notified"
+)
+SQL_CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id TEXT NOT NULL,
+        source TEXT NOT NULL,
+        title TEXT,
+        url TEXT,
+        price TEXT,
+        image_url TEXT,
+        description TEXT,
+        location TEXT,
+        category TEXT,
+        date_posted TEXT,
+        view_count INTEGER,
+        first_seen INTEGER NOT NULL,
+        last_checked INTEGER NOT NULL,
+        notified BOOLEAN NOT NULL DEFAULT 0,
+        PRIMARY KEY (source, id)
+    )
+"""
+SQL_INSERT = f"""
+    INSERT INTO listings ({LISTING_COLUMNS})
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+"""
+SQL_INSERT_NEW = SQL_INSERT + "ON CONFLICT(source, id) DO NOTHING"
+SQL_UPSERT = (
+    SQL_INSERT
+    + "ON CONFLICT(source, id) DO UPDATE SET last_checked = excluded.last_checked"
+)
+SQL_TOUCH = "UPDATE listings SET last_checked = ? WHERE source = ? AND id = ?"
+SQL_MARK_NOTIFIED = "UPDATE listings SET notified = 1 WHERE source = ? AND id = ?"
+SQL_ALL_KEYS = "SELECT source, id, notified FROM listings"
+
+# IN (...) lists are padded with NULLs up to one of these sizes so only a
+# handful of distinct status queries ever get compiled.
+STATUS_BATCH_SIZES = (20, 100, 500, MAX_BULK_PARAMS)
+
+
+def _now() -> int:
+    """Current UTC time as integer epoch seconds."""
+    return time.time_ns() // 1_000_000_000
+
+
+@functools.lru_cache(maxsize=None)
+def _status_sql(size: int) -> str:
+    placeholders = ",".join("?" * size)
+    return (
+        f"SELECT id, notified FROM listings WHERE source = ? AND id IN ({placeholders})"
+    )
+
 
 class ListingDatabase:
     def __init__(self, db_path: str = "./data/listings.db"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+        atexit.register(self.close)
         self._init_database()
+        self._load_cache()
 
     def _init_database(self):
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS listings (
-                    id TEXT PRIMARY KEY,
-                    source TEXT NOT NULL,
-                    title TEXT,
-                    url TEXT,
-                    price TEXT,
-                    image_url TEXT,
-                    description TEXT,
-                    location TEXT,
-                    category TEXT,
-                    date_posted TEXT,
-                    view_count INTEGER,
-                    first_seen TIMESTAMP NOT NULL,
-                    last_checked TIMESTAMP NOT NULL,
-                    notified BOOLEAN NOT NULL DEFAULT 0
-                )
-            """)
-
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_source 
-                ON listings(source)
-            """)
+            # page_size only takes effect on a fresh file (or after VACUUM)
+            cursor.execute("PRAGMA page_size = 4096")
+            cursor.execute("PRAGMA journal_mode = WAL")
+            cursor.execute(SQL_CREATE_TABLE.format(table="listings"))
 
             cursor.execute("""
                 SELECT COUNT(*) FROM pragma_table_info('listings') 
@@ -53,17 +112,88 @@ class ListingDatabase:
                 """)
                 logger.info("Added 'notified' column to existing database")
 
+            # Older databases keyed listings on id alone, so the same id on
+            # two sources collided; rebuild them with the (source, id) key
+            cursor.execute("""
+                SELECT pk FROM pragma_table_info('listings') WHERE name='source'
+            """)
+            if cursor.fetchone()[0] == 0:
+                self._rebuild_with_source_key(cursor)
+
+            # Older databases stored ISO-8601 strings; convert to epoch seconds
+            for column in ("first_seen", "last_checked"):
+                cursor.execute(f"""
+                    UPDATE listings
+                    SET {column} = CAST(strftime('%s', {column}) AS INTEGER)
+                    WHERE typeof({column}) = 'text'
+                """)
+                if cursor.rowcount:
+                    logger.info(
+                        "Converted %s %s values to epoch seconds",
+                        cursor.rowcount,
+                        column,
+                    )
+
+            # No query filters on notified alone; the index only slowed writes
+            cursor.execute("DROP INDEX IF EXISTS idx_unnotified")
+
             conn.commit()
-            logger.info(f"Database initialized at {self.db_path}")
+            logger.info("Database initialized at %s", self.db_path)
+
+    def _rebuild_with_source_key(self, cursor: sqlite3.Cursor):
+        """Copy listings into a table keyed on (source, id)."""
+        cursor.execute(SQL_CREATE_TABLE.format(table="listings_new"))
+        cursor.execute(f"""
+            INSERT OR IGNORE INTO listings_new ({LISTING_COLUMNS})
+            SELECT {LISTING_COLUMNS} FROM listings
+        """)
+        # Dropping the old table also drops its indexes (idx_source,
+        # idx_source_id), which the new primary key makes redundant
+        cursor.execute("DROP TABLE listings")
+        cursor.execute("ALTER TABLE listings_new RENAME TO listings")
+        cursor.execute("ANALYZE listings")
+        logger.info("Rebuilt listings table with a (source, id) primary key")
+
+    def _load_cache(self):
+        """Load every stored (source, id) key so repeat lookups skip SQLite."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(SQL_ALL_KEYS)
+            self._seen: Set[Tuple[str, str]] = set()
+            self._notified: Set[Tuple[str, str]] = set()
+            for source, listing_id, notified in cursor.fetchall():
+                self._seen.add((source, listing_id))
+                if notified:
+                    self._notified.add((source, listing_id))
+        logger.debug("Loaded %s listing keys into memory", len(self._seen))
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
 
     @contextmanager
     def _get_connection(self):
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._connect()
+            try:
+                yield self._conn
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def close(self):
+        """Close the shared database connection."""
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.execute("PRAGMA optimize")
+                except sqlite3.Error as e:
+                    logger.debug("PRAGMA optimize failed: %s", e)
+                self._conn.close()
+                self._conn = None
 
     def is_listing_seen(self, listing_id: str, source: str = "mobile_de") -> bool:
         """
@@ -76,15 +206,55 @@ class ListingDatabase:
         Returns:
             True if listing exists in database, False otherwise
         """
+        if (source, listing_id) in self._seen:
+            return True
+
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                "SELECT id FROM listings WHERE id = ? AND source = ?",
-                (listing_id, source),
-            )
+            cursor.execute(SQL_SEEN, (source, listing_id))
             result = cursor.fetchone()
+            if result is not None:
+                self._seen.add((source, listing_id))
             return result is not None
 
+    def get_status_bulk(
+        self, source: str, listing_ids: Iterable[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        """
+        Look up which listings have been seen and notified in bulk.
+
+        Args:
+            source: Source platform
+            listing_ids: Listing identifiers to look up
+
+        Returns:
+            Tuple of (seen_ids, notified_ids)
+        """
+        ids = list(dict.fromkeys(listing_ids))
+        seen = {i for i in ids if (source, i) in self._seen}
+        notified = {i for i in seen if (source, i) in self._notified}
+
+        # Only listings missing from the in-memory cache need a query
+        ids = [i for i in ids if i not in seen]
+        if not ids:
+            return seen, notified
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(ids), MAX_BULK_PARAMS):
+                chunk = ids[start : start + MAX_BULK_PARAMS]
+                size = next(n for n in STATUS_BATCH_SIZES if n >= len(chunk))
+                padding = (None,) * (size - len(chunk))
+                cursor.execute(_status_sql(size), (source, *chunk, *padding))
+                for listing_id, is_notified in cursor.fetchall():
+                    seen.add(listing_id)
+                    self._seen.add((source, listing_id))
+                    if is_notified:
+                        notified.add(listing_id)
+                        self._notified.add((source, listing_id))
+
+        return seen, notified
+
     def add_listing(
         self,
         listing_id: str,
@@ -100,7 +270,8 @@ class ListingDatabase:
         view_count: Optional[int] = None,
     ) -> bool:
         """
-        Add a new listing to the database.
+        Add a new listing to the database, or refresh its last_checked
+        timestamp if it is already stored.
 
         Args:
             listing_id: Unique identifier for the listing
@@ -118,21 +289,12 @@ class ListingDatabase:
         Returns:
             True if added successfully, False if already exists
         """
-        if self.is_listing_seen(listing_id, source):
-            logger.debug(f"Listing {listing_id} already exists in database")
-            return False
-
-        now = datetime.utcnow().isoformat()
+        now = _now()
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """
-                INSERT INTO listings 
-                (id, source, title, url, price, image_url, description, location, 
-                 category, date_posted, view_count, first_seen, last_checked, notified)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+                SQL_INSERT_NEW,
                 (
                     listing_id,
                     source,
@@ -147,12 +309,86 @@ class ListingDatabase:
                     view_count,
                     now,
                     now,
-                    0,
                 ),
             )
+            is_new = cursor.rowcount == 1
+            if not is_new:
+                cursor.execute(SQL_TOUCH, (now, source, listing_id))
             conn.commit()
-            logger.info(f"Added new listing {listing_id} from {source}")
-            return True
+            self._seen.add((source, listing_id))
+
+        if is_new:
+            logger.info("Added new listing %s from %s", listing_id, source)
+        else:
+            logger.debug("Listing %s already exists in database", listing_id)
+        return is_new
+
+    def bulk_insert(self, rows: List[Tuple]) -> int:
+        """
+        Insert many listings in a single transaction.
+
+        Args:
+            rows: Tuples of (id, source, title, url, price, image_url,
+                description, location, category, date_posted, view_count)
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+
+        now = _now()
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                SQL_UPSERT,
+                [(*row, now, now) for row in rows],
+            )
+            conn.commit()
+            self._seen.update((row[1], row[0]) for row in rows)
+            logger.info("Added %s new listings", len(rows))
+            return len(rows)
+
+    def bulk_touch(self, pairs: List[Tuple[str, str]]):
+        """
+        Update last_checked for many listings in a single transaction.
+
+        Args:
+            pairs: Tuples of (listing_id, source)
+        """
+        if not pairs:
+            return
+
+        now = _now()
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                SQL_TOUCH,
+                [(now, source, listing_id) for listing_id, source in pairs],
+            )
+            conn.commit()
+
+    def bulk_mark_notified(self, pairs: List[Tuple[str, str]]):
+        """
+        Mark many listings as notified in a single transaction.
+
+        Args:
+            pairs: Tuples of (listing_id, source)
+        """
+        if not pairs:
+            return
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                SQL_MARK_NOTIFIED,
+                [(source, listing_id) for listing_id, source in pairs],
+            )
+            conn.commit()
+            self._notified.update((source, listing_id) for listing_id, source in pairs)
+            logger.debug("Marked %s listings as notified", len(pairs))
 
     def update_last_checked(self, listing_id: str, source: str = "mobile_de"):
         """
@@ -162,18 +398,11 @@ class ListingDatabase:
             listing_id: Unique identifier for the listing
             source: Source platform
         """
-        now = datetime.utcnow().isoformat()
+        now = _now()
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                UPDATE listings 
-                SET last_checked = ?
-                WHERE id = ? AND source = ?
-            """,
-                (now, listing_id, source),
-            )
+            cursor.execute(SQL_TOUCH, (now, source, listing_id))
             conn.commit()
 
     def get_listing_count(self, source: Optional[str] = None) -> int:
@@ -209,12 +438,12 @@ class ListingDatabase:
         Returns:
             True if listing has been notified, False otherwise
         """
+        if (source, listing_id) in self._notified:
+            return True
+
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                "SELECT notified FROM listings WHERE id = ? AND source = ?",
-                (listing_id, source),
-            )
+            cursor.execute(SQL_IS_NOTIFIED, (source, listing_id))
             result = cursor.fetchone()
             return result is not None and bool(result[0])
 
@@ -228,16 +457,10 @@ class ListingDatabase:
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                UPDATE listings 
-                SET notified = 1
-                WHERE id = ? AND source = ?
-            """,
-                (listing_id, source),
-            )
+            cursor.execute(SQL_MARK_NOTIFIED, (source, listing_id))
             conn.commit()
-            logger.debug(f"Marked listing {listing_id} as notified")
+            self._notified.add((source, listing_id))
+            logger.debug("Marked listing %s as notified", listing_id)
 
     def cleanup_old_listings(self, days: int = 30, source: Optional[str] = None):
         """
@@ -247,9 +470,7 @@ class ListingDatabase:
             days: Age threshold in days
             source: Optional source filter
         """
-        from datetime import timedelta
-
-        cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
+        cutoff = _now() - days * 86400
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
@@ -261,5 +482,10 @@ class ListingDatabase:
             else:
                 cursor.execute("DELETE FROM listings WHERE first_seen < ?", (cutoff,))
             deleted = cursor.rowcount
+            if deleted:
+                cursor.execute("ANALYZE listings")
             conn.commit()
-            logger.info(f"Cleaned up {deleted} old listings")
+
+        if deleted:
+            self._load_cache()
+        logger.info("Cleaned up %s old listings", deleted)
@@ -1,13 +1,20 @@
 import os
-import json
 import logging
-from typing import Optional
+import time
+from datetime import datetime, timezone
+from typing import List, Optional
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 
 logger = logging.getLogger(__name__)
 
+# Discord accepts at most 10 embeds in a single webhook message
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_RETRIES = 3
+
 
 class DiscordNotifier:
     def __init__(self, webhook_url: Optional[str] = None):
@@ -15,6 +22,10 @@ class DiscordNotifier:
         if not self.webhook_url:
             logger.warning("Discord webhook URL not set.")
 
+        # Keep the TLS connection to Discord alive between webhook calls
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
     def send_vehicle_notification(
         self,
         title: str,
@@ -48,19 +59,60 @@ class DiscordNotifier:
             logger.error("Cannot send notification: webhook URL not configured")
             return False
 
-        fields = []
+        embed = self.build_vehicle_embed(
+            title=title,
+            url=url,
+            price=price,
+            year=year,
+            mileage=mileage,
+            location=location,
+            image_url=image_url,
+            description=description,
+            color=color,
+        )
+        embed["timestamp"] = self._get_timestamp()
+
+        return self._send_webhook({"embeds": [embed]})
+
+    def build_vehicle_embed(
+        self,
+        title: str,
+        url: str,
+        price: str,
+        year: Optional[str] = None,
+        mileage: Optional[str] = None,
+        location: Optional[str] = None,
+        image_url: Optional[str] = None,
+        description: Optional[str] = None,
+        color: int = 0x3498DB,
+    ) -> dict:
+        """
+        Build the Discord embed for a vehicle listing.
+
+        The embed carries no timestamp; the send methods add one.
 
-        if price:
-            fields.append({"name": "Price", "value": price, "inline": True})
+        Args:
+            Same as send_vehicle_notification
 
-        if location:
-            fields.append({"name": "Location", "value": location, "inline": True})
+        Returns:
+            Discord embed dictionary
+        """
+        field_values = (
+            ("Price", price),
+            ("Year", year),
+            ("Mileage", mileage),
+            ("Location", location),
+        )
 
         embed = {
             "title": title,
             "url": url,
             "color": color,
-            "fields": fields,
+            "fields": [
+                {"name": name, "value": value, "inline": True}
+                for name, value in field_values
+                if value
+            ],
         }
 
         if description:
@@ -73,11 +125,40 @@ class DiscordNotifier:
             embed["thumbnail"] = {"url": image_url}
 
             embed["footer"] = {"text": "New Listing Alert"}
-        embed["timestamp"] = self._get_timestamp()
 
-        discord_data = {"embeds": [embed]}
+        return embed
 
-        return self._send_webhook(discord_data)
+    def send_many(self, embeds: List[dict]) -> List[bool]:
+        """
+        Send several embeds to Discord, up to ten per webhook message.
+
+        Args:
+            embeds: Discord embed dictionaries
+
+        Returns:
+            Whether each embed was delivered, in input order
+        """
+        if not embeds:
+            return []
+
+        if not self.webhook_url:
+            logger.error("Cannot send notification: webhook URL not configured")
+            return [False] * len(embeds)
+
+        timestamp = self._get_timestamp()
+        for embed in embeds:
+            embed.setdefault("timestamp", timestamp)
+
+        delivered = []
+        for start in range(0, len(embeds), MAX_EMBEDS_PER_MESSAGE):
+            batch = embeds[start : start + MAX_EMBEDS_PER_MESSAGE]
+            delivered.extend([self._send_webhook({"embeds": batch})] * len(batch))
+
+        return delivered
+
+    def close(self):
+        """Release the HTTP session."""
+        self._session.close()
 
     def send_notification(
         self, title: str, message: str, color: int = 0x3498DB
@@ -119,27 +200,46 @@ class DiscordNotifier:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            headers = {"Content-Type": "application/json"}
-            response = requests.post(
-                self.webhook_url, data=json.dumps(data), headers=headers, timeout=10
-            )
+        headers = {"Content-Type": "application/json"}
+
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                response = self._session.post(
+                    self.webhook_url,
+                    data=orjson.dumps(data),
+                    headers=headers,
+                    timeout=10,
+                )
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Error sending Discord notification: {e}")
+                return False
 
             if response.status_code == 204:
                 logger.info("Discord notification sent successfully")
                 return True
-            else:
-                logger.error(
-                    f"Failed to send Discord notification: {response.status_code}, {response.text}"
-                )
-                return False
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error sending Discord notification: {e}")
+            if response.status_code == 429 and attempt < MAX_RETRIES:
+                delay = self._get_retry_after(response, attempt)
+                logger.warning(f"Discord rate limit hit, retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+
+            logger.error(
+                f"Failed to send Discord notification: {response.status_code}, {response.text}"
+            )
             return False
 
+        return False
+
     @staticmethod
-    def _get_timestamp() -> str:
-        from datetime import datetime
+    def _get_retry_after(response: requests.Response, attempt: int) -> float:
+        """Get the delay requested by a 429 response, with exponential fallback."""
+        retry_after = response.headers.get("Retry-After")
+        try:
+            return float(retry_after)
+        except (TypeError, ValueError):
+            return float(2**attempt)
 
-        return datetime.utcnow().isoformat()
+    @staticmethod
+    def _get_timestamp() -> str:
+        return datetime.now(timezone.utc).isoformat()
@@ -1,4 +1,4 @@
 from .base import BaseScraper, Listing
-from .bazos import BazosScraper
+from .bazos import BazosScraper, create_session
 
-__all__ = ["BaseScraper", "Listing", "BazosScraper"]
+__all__ = ["BaseScraper", "Listing", "BazosScraper", "create_session"]
@@ -1,43 +1,29 @@
 import logging
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import List, Dict, Optional
 
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True, frozen=True)
 class Listing:
     """Represents a vehicle listing from any source."""
 
-    def __init__(
-        self,
-        listing_id: str,
-        source: str,
-        title: str,
-        url: str,
-        price: str,
-        year: Optional[str] = None,
-        mileage: Optional[str] = None,
-        location: Optional[str] = None,
-        image_url: Optional[str] = None,
-        description: Optional[str] = None,
-        category: Optional[str] = None,
-        date_posted: Optional[str] = None,
-        view_count: Optional[int] = None,
-    ):
-        self.listing_id = listing_id
-        self.source = source
-        self.title = title
-        self.url = url
-        self.price = price
-        self.year = year
-        self.mileage = mileage
-        self.location = location
-        self.image_url = image_url
-        self.description = description
-        self.category = category
-        self.date_posted = date_posted
-        self.view_count = view_count
+    listing_id: str
+    source: str
+    title: str
+    url: str
+    price: str
+    year: Optional[str] = None
+    mileage: Optional[str] = None
+    location: Optional[str] = None
+    image_url: Optional[str] = None
+    description: Optional[str] = None
+    category: Optional[str] = None
+    date_posted: Optional[str] = None
+    view_count: Optional[int] = None
 
     def __repr__(self):
         return f"<Listing {self.source}:{self.listing_id} - {self.title}>"
@@ -62,6 +48,16 @@ class BaseScraper(ABC):
         """
         pass
 
+    def discard_validators(self, search_config: Dict):
+        """Forget cached page validators for a search.
+
+        Scrapers that don't send conditional requests have nothing to discard.
+
+        Args:
+            search_config: Dictionary containing search parameters
+        """
+        pass
+
     def _extract_id_from_url(self, url: str) -> Optional[str]:
         """Extract listing ID from URL.
 
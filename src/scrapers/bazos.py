@@ -1,30 +1,144 @@
 import logging
 import re
-from typing import Dict, List, Optional
-from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import quote, urljoin
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+from urllib3.util.retry import Retry
 
 from .base import BaseScraper, Listing
 
 
 logger = logging.getLogger(__name__)
 
+_BASE_URL_RE = re.compile(r"(https?://[^/]+)")
+_ID_RE = re.compile(r"/inzerat/(\d+)/")
+_DATE_RE = re.compile(r"\[(\d{1,2}\.\d{1,2}\.\s*\d{4})\]")
+
+# Listings per results page; later pages are addressed by this offset
+PAGE_SIZE = 20
+
+# Listing headers and their detail cells, matched in document order
+_LISTING_SELECTOR = (
+    "div.inzeratynadpis, div.inzeratycena, div.inzeratylok, div.inzeratyview"
+)
+
+
+# Search and page URLs depend only on hashable config values, so they are
+# memoised across scrape cycles instead of being rebuilt every run
+@lru_cache(maxsize=256)
+def _build_search_url_cached(
+    base_url: str,
+    search_term: str,
+    price_min,
+    price_max,
+    location: str,
+    radius,
+    order: str,
+) -> Optional[str]:
+    if not search_term:
+        return None
+
+    url = f"{base_url}/?hledat={quote(search_term)}"
+
+    if price_min:
+        url += f"&cenaod={price_min}"
+    if price_max:
+        url += f"&cenado={price_max}"
+    if location:
+        url += f"&hlokalita={quote(location)}"
+    if radius:
+        url += f"&humkreis={radius}"
+    if order:
+        url += f"&order={order}"
+
+    url += "&rubriky=auto&kitx=ano"
+
+    return url
+
+
+@lru_cache(maxsize=256)
+def _get_page_url_cached(base_url: str, page_num: int) -> str:
+    if page_num == 0:
+        return base_url
+
+    head, sep, tail = base_url.partition("/?")
+    return f"{head}/{page_num * PAGE_SIZE}/?{tail}" if sep else base_url
+
+
+def create_session() -> requests.Session:
+    """Create an HTTP session suitable for sharing between Bazos scrapers.
+
+    Returns:
+        Session with browser headers and a pooled, retrying adapter
+    """
+    session = requests.Session()
+    session.headers.update(
+        {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+            "Accept-Language": "sk,cs;q=0.9,en;q=0.8",
+        }
+    )
+    # Large keep-alive pool for concurrent page fetches; transient gateway
+    # errors are retried on the pooled connection.
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _format_location(location: str) -> str:
+    """Separate a trailing postal code from the town name.
+
+    Location cells join the town and postal code without a separator
+    (e.g. "Bratislava811 01"); the result reads "Bratislava, 811 01".
+
+    Args:
+        location: Raw location text
+
+    Returns:
+        Location with the postal code split off, or the input unchanged
+    """
+    # Postal codes are 3-5 digits, an optional space, then 2 digits
+    if not location[-2:].isdigit():
+        return location
+
+    body = location[:-2]
+    if body[-1:].isspace():
+        body = body[:-1]
+
+    name = body.rstrip("0123456789")
+    if len(body) - len(name) < 3:
+        return location
+    if len(body) - len(name) > 5:
+        name = body[:-5]
+
+    postal = location[len(name) :]
+    return f"{name.strip().rstrip(',')}, {postal}"
+
 
 class BazosScraper(BaseScraper):
-    def __init__(self, source_name: str):
+    def __init__(self, source_name: str, session: Optional[requests.Session] = None):
         super().__init__(source_name)
-        self.base_url = None
-
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "sk,cs;q=0.9,en;q=0.8",
-            }
-        )
+        # Host for searches built from search_term ("bazos_sk" -> auto.bazos.sk).
+        # Never reassigned, since one scraper serves concurrent searches.
+        self.base_url = f"https://auto.bazos.{source_name.rpartition('_')[2]}"
+        # Cache validators (ETag / Last-Modified) per page URL for conditional GETs
+        self._validators: Dict[str, Dict[str, str]] = {}
+        # Pages that ended pagination when their validators were saved
+        self._end_pages: Set[str] = set()
+        self.session = session or create_session()
 
     def scrape(self, search_config: Dict) -> List[Listing]:
         """Scrape Bazos listings based on search configuration.
@@ -51,47 +165,162 @@ class BazosScraper(BaseScraper):
             self.logger.error("No URL or search parameters provided")
             return []
 
-        base_url_match = re.match(r"(https?://[^/]+)", url)
+        base_url = self.base_url
+        base_url_match = _BASE_URL_RE.match(url)
         if base_url_match:
-            self.base_url = base_url_match.group(1)
-            self.logger.debug(f"Using base URL: {self.base_url}")
+            base_url = base_url_match.group(1)
+            self.logger.debug("Using base URL: %s", base_url)
 
         max_pages = search_config.get("max_pages", 3)
+        page_urls = self._get_page_urls(url, max_pages)
 
         all_listings = []
 
-        for page_num in range(max_pages):
-            page_url = self._get_page_url(url, page_num)
-            self.logger.info(f"Scraping page {page_num + 1}/{max_pages}: {page_url}")
+        # Page 1 decides whether there is more to fetch: a page with fewer
+        # than PAGE_SIZE listings is the last one. Only then are the
+        # remaining pages fetched together and parsed in order.
+        self.logger.info("Scraping page 1/%s: %s", max_pages, page_urls[0])
+        listings, more = self._read_page(
+            0, page_urls[0], lambda: self._fetch_page(page_urls[0]), base_url
+        )
+        all_listings.extend(listings)
+
+        rest = page_urls[1:] if more else []
+        if rest:
+            with ThreadPoolExecutor(max_workers=len(rest)) as executor:
+                pages = []
+                for page_num, page_url in enumerate(rest, start=1):
+                    self.logger.info(
+                        "Scraping page %s/%s: %s", page_num + 1, max_pages, page_url
+                    )
+                    pages.append(executor.submit(self._fetch_page, page_url))
+
+                for page_num, (page_url, page) in enumerate(zip(rest, pages), start=1):
+                    listings, more = self._read_page(
+                        page_num, page_url, page.result, base_url
+                    )
+                    all_listings.extend(listings)
+                    if not more:
+                        break
+
+        self.logger.info("Total listings found: %s", len(all_listings))
+        return all_listings
 
-            try:
-                response = self.session.get(page_url, timeout=30)
-                response.raise_for_status()
-                response.encoding = "utf-8"
+    def _read_page(
+        self,
+        page_num: int,
+        page_url: str,
+        fetch: Callable[[], Tuple[Optional[bytes], Dict[str, str]]],
+        base_url: str,
+    ) -> Tuple[List[Listing], bool]:
+        """Fetch and parse one results page.
 
-                soup = BeautifulSoup(response.text, "html.parser")
-                listings = self._parse_listings(soup)
+        Args:
+            page_num: Page number (0-indexed)
+            page_url: URL of the page
+            fetch: Returns the page body and validators, as _fetch_page does
+            base_url: Scheme and host used to resolve relative links
 
-                if not listings:
-                    self.logger.info(f"No more listings found on page {page_num + 1}")
-                    break
+        Returns:
+            Listings found on the page and whether later pages should be read
+        """
+        try:
+            content, validators = fetch()
+            if content is None:
+                if page_url in self._end_pages:
+                    self.logger.info(
+                        "Page %s not modified and still the last page", page_num + 1
+                    )
+                    return [], False
+                self.logger.info("Page %s not modified, skipping", page_num + 1)
+                return [], True
+
+            tree = LexborHTMLParser(content)
+            listings = self._parse_listings(tree, base_url)
+            last_page = len(listings) < PAGE_SIZE
+
+            # Validators are kept only for pages consumed here; the bot
+            # discards them again if storing the listings fails
+            self._store_validators(page_url, validators, last_page)
+
+            if not listings:
+                self.logger.info("No more listings found on page %s", page_num + 1)
+                return [], False
+
+            self.logger.info(
+                "Found %s listings on page %s", len(listings), page_num + 1
+            )
+            return listings, not last_page
+
+        except requests.exceptions.RequestException as e:
+            self.logger.error("Error fetching Bazos page %s: %s", page_num + 1, e)
+        except Exception as e:
+            self.logger.error(
+                "Error parsing Bazos page %s: %s", page_num + 1, e, exc_info=True
+            )
+        return [], False
+
+    def _fetch_page(self, page_url: str) -> Tuple[Optional[bytes], Dict[str, str]]:
+        """Download a single results page.
+
+        Sends the validators from the previous fetch of the same URL, if the
+        server provided any, so an unchanged page costs a bodyless 304.
 
-                all_listings.extend(listings)
-                self.logger.info(
-                    f"Found {len(listings)} listings on page {page_num + 1}"
-                )
+        Args:
+            page_url: URL of the page to fetch
 
-            except requests.exceptions.RequestException as e:
-                self.logger.error(f"Error fetching Bazos page {page_num + 1}: {e}")
-                break
-            except Exception as e:
-                self.logger.error(
-                    f"Error parsing Bazos page {page_num + 1}: {e}", exc_info=True
-                )
-                break
+        Returns:
+            Raw response body (None if the page has not changed) and the
+            validators to send next time
+        """
+        response = self.session.get(
+            page_url, headers=self._validators.get(page_url), timeout=30
+        )
+        if response.status_code == 304:
+            return None, {}
+        response.raise_for_status()
 
-        self.logger.info(f"Total listings found: {len(all_listings)}")
-        return all_listings
+        validators = {}
+        if response.headers.get("ETag"):
+            validators["If-None-Match"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = response.headers["Last-Modified"]
+
+        return response.content, validators
+
+    def _store_validators(
+        self, page_url: str, validators: Dict[str, str], last_page: bool
+    ):
+        """Remember the validators of a parsed page for the next fetch.
+
+        Args:
+            page_url: URL of the page
+            validators: Conditional request headers for the page
+            last_page: Whether the page was short and ended pagination
+        """
+        if validators:
+            self._validators[page_url] = validators
+        else:
+            self._validators.pop(page_url, None)
+
+        if last_page:
+            self._end_pages.add(page_url)
+        else:
+            self._end_pages.discard(page_url)
+
+    def discard_validators(self, search_config: Dict):
+        """Forget saved validators so the search's pages are fetched in full.
+
+        Args:
+            search_config: Search configuration dictionary
+        """
+        url = search_config.get("url") or self._build_search_url(search_config)
+        if not url:
+            return
+
+        for page_url in self._get_page_urls(url, search_config.get("max_pages", 3)):
+            self._validators.pop(page_url, None)
+            self._end_pages.discard(page_url)
 
     def _build_search_url(self, search_config: Dict) -> Optional[str]:
         """Build search URL from configuration parameters.
@@ -102,34 +331,31 @@ class BazosScraper(BaseScraper):
         Returns:
             Constructed URL or None
         """
-        from urllib.parse import quote
-
-        search_term = search_config.get("search_term", "")
-        price_min = search_config.get("price_min", "")
-        price_max = search_config.get("price_max", "")
-        location = search_config.get("location", "")
-        radius = search_config.get("radius", "25")
-        order = search_config.get("order", "")
-
-        if not search_term:
-            return None
+        return _build_search_url_cached(
+            self.base_url,
+            search_config.get("search_term", ""),
+            search_config.get("price_min", ""),
+            search_config.get("price_max", ""),
+            search_config.get("location", ""),
+            search_config.get("radius", "25"),
+            search_config.get("order", ""),
+        )
 
-        url = f"{self.base_url}/?hledat={quote(search_term)}"
+    def _get_page_urls(self, base_url: str, max_pages: int) -> List[str]:
+        """Generate the distinct page URLs of a search.
 
-        if price_min:
-            url += f"&cenaod={price_min}"
-        if price_max:
-            url += f"&cenado={price_max}"
-        if location:
-            url += f"&hlokalita={quote(location)}"
-        if radius:
-            url += f"&humkreis={radius}"
-        if order:
-            url += f"&order={order}"
+        URLs without a "/?" query can't be paginated and map to the same page.
 
-        url += "&rubriky=auto&kitx=ano"
+        Args:
+            base_url: The base search URL
+            max_pages: Maximum number of pages
 
-        return url
+        Returns:
+            Page URLs in order
+        """
+        return list(
+            dict.fromkeys(self._get_page_url(base_url, n) for n in range(max_pages))
+        )
 
     def _get_page_url(self, base_url: str, page_num: int) -> str:
         """Generate URL for a specific page.
@@ -143,143 +369,130 @@ class BazosScraper(BaseScraper):
         Returns:
             URL for the specific page
         """
-        if page_num == 0:
-            return base_url
-
-        offset = page_num * 20
-
-        if "/?" in base_url:
-            parts = base_url.split("/?")
-            return f"{parts[0]}/{offset}/?{parts[1]}"
-        else:
-            return base_url
+        return _get_page_url_cached(base_url, page_num)
 
-    def _parse_listings(self, soup: BeautifulSoup) -> List[Listing]:
+    def _parse_listings(self, tree: LexborHTMLParser, base_url: str) -> List[Listing]:
         """Parse listing items from search results page.
 
         Args:
-            soup: BeautifulSoup object of the page
+            tree: Parsed HTML document of the page
+            base_url: Scheme and host used to resolve relative links
 
         Returns:
             List of Listing objects
         """
         listings = []
 
-        listing_divs = soup.find_all("div", class_="inzeratynadpis")
+        # One query for headers and detail cells; each detail belongs to the
+        # most recent header before it.
+        rows = []
+        for node in tree.css(_LISTING_SELECTOR):
+            classes = (node.attributes.get("class") or "").split()
+            if "inzeratynadpis" in classes:
+                rows.append((node, []))
+            elif rows:
+                rows[-1][1].append(node)
 
-        self.logger.debug(f"Found {len(listing_divs)} listing divs")
+        self.logger.debug("Found %s listing divs", len(rows))
 
-        for div in listing_divs:
+        for div, details in rows:
             try:
-                listing = self._parse_listing_item(div)
+                listing = self._parse_listing_item(div, details, base_url)
                 if listing:
                     listings.append(listing)
             except Exception as e:
-                self.logger.debug(f"Error parsing listing item: {e}")
+                self.logger.debug("Error parsing listing item: %s", e)
                 continue
 
         return listings
 
-    def _parse_listing_item(self, div) -> Optional[Listing]:
+    def _parse_listing_item(
+        self, div: LexborNode, details: List[LexborNode], base_url: str
+    ) -> Optional[Listing]:
         """Parse a single listing from a div element.
 
         Args:
-            div: BeautifulSoup div element with class 'inzeratynadpis'
+            div: HTML node of the div with class 'inzeratynadpis'
+            details: Price, location and view divs following the header
+            base_url: Scheme and host used to resolve relative links
 
         Returns:
             Listing object or None
         """
-        link_elem = div.find("a", href=re.compile(r"/inzerat/\d+/"))
+        link_elem = div.css_first('a[href*="/inzerat/"]')
         if not link_elem:
             return None
 
-        relative_url = link_elem.get("href")
+        relative_url = link_elem.attributes.get("href")
         if not relative_url:
             return None
 
-        url = urljoin(self.base_url, relative_url)
+        url = urljoin(base_url, relative_url)
         listing_id = self._extract_id_from_url(url)
 
         if not listing_id:
             return None
 
         title = "Unknown"
-        title_elem = div.find("h2", class_="nadpis")
-        if title_elem:
-            title_link = title_elem.find("a")
-            if title_link:
-                title = title_link.get_text(strip=True)
+        title_link = div.css_first("h2.nadpis a")
+        if title_link:
+            title = title_link.text(strip=True)
 
         date_posted = None
-        date_span = div.find("span", class_="velikost10")
+        date_span = div.css_first("span.velikost10")
         if date_span:
-            date_text = date_span.get_text()
-            date_match = re.search(r"\[(\d{1,2}\.\d{1,2}\.\s*\d{4})\]", date_text)
+            date_text = date_span.text(deep=False)
+            date_match = _DATE_RE.search(date_text)
             if date_match:
                 date_posted = date_match.group(1).strip()
 
         image_url = None
-        img_elem = div.find("img", class_="obrazek")
-        if img_elem and img_elem.get("src"):
-            img_src = img_elem.get("src")
+        img_elem = div.css_first("img.obrazek")
+        if img_elem and img_elem.attributes.get("src"):
+            img_src = img_elem.attributes.get("src")
             if img_src and "no-image" not in img_src.lower():
-                image_url = urljoin(self.base_url, img_src)
+                image_url = urljoin(base_url, img_src)
 
         description = None
-        desc_elem = div.find("div", class_="popis")
+        desc_elem = div.css_first("div.popis")
         if desc_elem:
-            raw_desc = desc_elem.get_text(" ", strip=True)
-            description = raw_desc
+            raw_desc = desc_elem.text(separator=" ")
+            description = " ".join(raw_desc.split())
             if len(description) > 200:
                 description = description[:200].rstrip() + "..."
 
         price = "N/A"
         location = None
         view_count = None
-        category = None
 
-        current = div
-        for _ in range(10):
-            current = current.next_sibling
-            if current is None:
-                break
-
-            if not hasattr(current, "get"):
-                continue
-
-            classes = current.get("class", [])
+        # Location and view cells hold their text directly; price wraps it in
+        # <b>/<span>, so it still needs a deep walk
+        for detail in details:
+            classes = (detail.attributes.get("class") or "").split()
 
             if "inzeratycena" in classes:
-                price_text = current.get_text(strip=True)
+                price_text = detail.text(strip=True)
                 if price_text and price_text != "N/A":
                     price = price_text
 
             elif "inzeratylok" in classes:
-                loc_text = current.get_text(strip=True)
+                loc_text = detail.text(deep=False, strip=True)
                 location = loc_text.split("\n")[0].strip() if loc_text else None
-            if location:
-                match = re.match(r"^(.*?)(\d{3,5}\s?\d{2})$", location)
-                if match:
-                    name = match.group(1).strip().rstrip(",")
-                    postal = match.group(2).strip()
-                    location = f"{name}, {postal}"
 
             elif "inzeratyview" in classes:
-                view_text = current.get_text(strip=True)
-                view_match = re.search(r"(\d+)\s*x", view_text)
-                if view_match:
-                    view_match = re.search(r"(\d+)\s*x", view_text)
-                    if view_match:
-                        view_count = int(view_match.group(1))
-                    if match:
-                        name = match.group(1).strip()
-                        postal = match.group(2).strip()
-                        location = f"{name}, {postal}"
-                    pass
-
-        category_match = re.search(r"https?://([^.]+)\.bazos\.(sk|cz)", url)
-        if category_match:
-            category = category_match.group(1)
+                head, _, _ = detail.text(deep=False, strip=True).partition("x")
+                head = head.strip()
+                if head.isdigit():
+                    view_count = int(head)
+
+        if location:
+            location = _format_location(location)
+
+        # Listing URLs are always https://<category>.bazos.<tld>/...
+        try:
+            category = url.split("://", 1)[1].split(".", 1)[0]
+        except IndexError:
+            category = None
 
         return Listing(
             listing_id=listing_id,
@@ -307,7 +520,7 @@ class BazosScraper(BaseScraper):
         Returns:
             Listing ID as string or None
         """
-        match = re.search(r"/inzerat/(\d+)/", url)
+        match = _ID_RE.search(url)
         if match:
             return match.group(1)
         return None
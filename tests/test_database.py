@@ -43,27 +43,31 @@ for i, listing in enumerate(listings[:3], 1):
     )
     print(f"  URL:         {listing.url[:60]}...")
 
-    # Add to database
-    db.add_listing(
-        listing_id=listing.listing_id,
-        source=listing.source,
-        title=listing.title,
-        url=listing.url,
-        price=listing.price,
-        image_url=listing.image_url,
-        description=listing.description,
-        location=listing.location,
-        category=listing.category,
-        date_posted=listing.date_posted,
-        view_count=listing.view_count,
+# Add to database in a single transaction
+rows = [
+    (
+        listing.listing_id,
+        listing.source,
+        listing.title,
+        listing.url,
+        listing.price,
+        listing.image_url,
+        listing.description,
+        listing.location,
+        listing.category,
+        listing.date_posted,
+        listing.view_count,
     )
+    for listing in listings[:3]
+]
+db.bulk_insert(rows)
 
 # Verify database
 print(f"\n\n{'=' * 70}")
 print("DATABASE VERIFICATION")
 print("=" * 70 + "\n")
 
-conn = sqlite3.connect("./data/test_improved.db")
+conn = sqlite3.connect("./data/test.db")
 cursor = conn.cursor()
 cursor.execute("PRAGMA table_info(listings)")
 columns = cursor.fetchall()